@@ -1,63 +1,127 @@
-from flask import Flask, render_template, request, send_file
-import subprocess
+from flask import Flask, Response, jsonify, render_template, request, send_file
 import os
-import time  # Added for waiting functionality
+import threading
+import browser_pool
+import digest
+import metrics
+import registry
+import results
+import scheduler
+import sweep
+from jobs import JobQueue, DONE, FAILED
 
 app = Flask(__name__)
 
-# Dictionary mapping think tanks to their respective scraper scripts
-SCRAPER_SCRIPTS = {
-    "Atlantic Council": "scraperACwebsite.py",
-    "AEI": "scraperAEIwebsite.py",
-    "Baker Institute": "scraperBakerwebsite.py",
-    "Belfer Center": "scraperBelferwebsite.py",
-    "Brookings Institution": "scraperBrookingswebsite.py",
-    "Carnegie Endowment": "scraperCEIPwebsite.py",
-    "Chicago Council": "scraperChicagowebsite.py",
-    "CSIS": "scraperCSISwebsite.py",
-    "FDD": "scraperFDDwebsite.py",
-    "GMF": "scraperGMFwebsite.py",
-    "Heritage Foundation": "scraperHeritagewebsite.py",
-    "Hudson Institute": "scraperHudsonwebsite.py",
-    "MEI": "scraperMEIwebsite.py",
-    "Pew Research Center": "scraperPewwebsite.py",
-    "PIIE": "scraperPIIEwebsite.py",
-    "Quincy Institute": "scraperQuincywebsite.py",
-    "Stimson Center": "scraperStimsonwebsite.py",
-    "USIP": "scraperUSIPwebsite.py",
-    "Wilson Center": "scraperWilsonwebsite.py",
-    "WINEP": "scraperWINEPwebsite.py"
-}
-
-OUTPUT_FOLDER = "output_files"
+OUTPUT_FOLDER = results.OUTPUT_FOLDER
+
+job_queue = JobQueue()
+
+# Import all scrapers once per worker instead of once per request
+registry.preload()
+
+# Optionally start Chrome sessions in the background so the first Selenium job finds them warm
+if os.environ.get("SCRAPER_BROWSER_WARM") == "1":
+    threading.Thread(target=browser_pool.pool.warm, daemon=True).start()
+
+# Optionally refresh every think tank in the background so downloads are served from cache.
+# Run the app as one gunicorn worker with several threads (jobs live in process memory);
+# scheduler.acquire_lock keeps any second process on the host from refreshing again.
+refresh_schedule = None
+if scheduler.ENABLED:
+    refresh_schedule = scheduler.start(
+        lambda think_tank, ttl: job_queue.submit(think_tank, results.get_report, think_tank, False, ttl, key=think_tank)
+    )
 
 @app.route("/")
 def home():
-    return render_template("index.html", think_tanks=SCRAPER_SCRIPTS.keys())
+    return render_template("index.html", think_tanks=registry.SCRAPERS.keys())
 
 @app.route("/run_scraper", methods=["POST"])
 def run_scraper():
     think_tank = request.form["think_tank"]
-    script_path = SCRAPER_SCRIPTS.get(think_tank)
+    force = request.values.get("force") == "1"  # Bypass the result cache
 
-    if script_path:
-        print(f"Running script: {script_path}")  # Debugging output
-        subprocess.run(["python3", script_path], check=True)
+    if think_tank in registry.SCRAPERS:
+        path = None if force else results.fresh_report(think_tank)
+        if path:
+            metrics.CACHE_HITS.inc(think_tank=think_tank, cache="report")
+            job = job_queue.completed(think_tank, path)
+        else:
+            job = job_queue.submit(think_tank, results.get_report, think_tank, force, key=think_tank)
+        return (
+            f"Started {think_tank}: <a href='/jobs/{job.id}'>check status</a> | "
+            f"<a href='/jobs/{job.id}/result'>download report when ready</a>",
+            202,
+        )
 
-        # Define the expected Word file path
-        word_file = os.path.join(OUTPUT_FOLDER, f"{think_tank}.docx")
-        print(f"Checking for file: {word_file}")  # Debugging output
+    return "Invalid request", 400
 
-        # Wait up to 10 seconds for the file to appear
-        for _ in range(10):
-            if os.path.exists(word_file):
-                return f"<a href='/download/{think_tank}'>Download {think_tank} report</a>"
-            time.sleep(1)  # Wait for 1 second before checking again
+@app.route("/run_all", methods=["POST"])
+def run_all():
+    force = request.values.get("force") == "1"  # Bypass the result cache
+    progress = sweep.new_progress(registry.SCRAPERS.keys())
+    # Repeated clicks share the sweep already running instead of taking another worker thread
+    job = job_queue.submit("All think tanks", sweep.run_all, progress, force, key="run_all")
+    if job.progress is None:
+        job.progress = progress
+    return (
+        f"Started all think tanks: <a href='/jobs/{job.id}'>check progress</a>",
+        202,
+    )
 
-        print("Error: Word file not found after waiting.")  # Debugging output
-        return "Error: Word file not found.", 500
+@app.route("/digest")
+def build_digest():
+    force = request.values.get("force") == "1"  # Bypass the result cache
 
-    return "Invalid request", 400
+    # Everything cached: the digest is just a render, so serve it in this request.
+    # Nothing goes through results.get_report here, so the cache hits are counted in this one place.
+    if not force and digest.is_fresh():
+        for think_tank in registry.SCRAPERS:
+            metrics.CACHE_HITS.inc(think_tank=think_tank, cache="report")
+        return send_file(digest.build_digest(refresh=False), as_attachment=True)
+
+    progress = sweep.new_progress(registry.SCRAPERS.keys())
+    job = job_queue.submit("Digest", digest.build_digest, progress, force, key="digest")
+    if job.progress is None:  # A digest already being built keeps its own progress table
+        job.progress = progress
+    return (
+        f"Building digest: <a href='/jobs/{job.id}'>check progress</a> | "
+        f"<a href='/jobs/{job.id}/result'>download digest when ready</a>",
+        202,
+    )
+
+@app.route("/jobs/<job_id>")
+def job_status(job_id):
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job.to_dict())
+
+@app.route("/jobs/<job_id>/result")
+def job_result(job_id):
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    if job.status == DONE and isinstance(job.result, str):
+        return send_file(job.result, as_attachment=True)
+    if job.status == DONE:
+        # Multi-site jobs have no single file, point at each site's report instead
+        return jsonify({think_tank: f"/download/{think_tank}" for think_tank, path in job.result.items() if path})
+    if job.status == FAILED:
+        return jsonify(job.to_dict()), 500
+    return jsonify(job.to_dict()), 202
+
+@app.route("/schedule")
+def schedule():
+    # Read from the article store, so this works whichever process runs the schedule
+    if not scheduler.ENABLED:
+        return jsonify({"enabled": False})
+    return jsonify({"enabled": True, "next_refresh": scheduler.status()})
+
+@app.route("/metrics")
+def metrics_endpoint():
+    # Prometheus text exposition format
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
 
 @app.route("/download/<think_tank>")
 def download(think_tank):
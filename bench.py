@@ -0,0 +1,141 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import subprocess
+import tempfile
+import time
+import engine
+import exports
+import fetch
+import fixtures
+import parsing
+import ratelimit
+import report
+import results
+import store
+
+STAGES = ("fetch", "parse", "extract", "render", "total")
+
+
+@contextlib.contextmanager
+def isolated(workdir):
+    """
+    Points the article store, report folder and HTTP cache at `workdir`, turns off rate
+    limiting and silences progress output, so benchmarks never touch real results.
+    """
+    saved = (store.DB_PATH, results.OUTPUT_FOLDER, fetch.CACHE_DIR, exports.EXPORT_CSV, ratelimit.RATE)
+    store.DB_PATH = os.path.join(workdir, "articles.db")
+    results.OUTPUT_FOLDER = os.path.join(workdir, "output_files")
+    exports.EXPORT_CSV = False
+    ratelimit.RATE = 0  # The stand-in server needs no politeness, and waits would skew the timings
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        store.DB_PATH, results.OUTPUT_FOLDER, fetch.CACHE_DIR, exports.EXPORT_CSV, ratelimit.RATE = saved
+
+
+def run_once(site, workdir):
+    """
+    Times each stage of one scrape of a replayed site, then the whole engine run end to end.
+    Returns (timings in seconds, article count).
+    """
+    timings = {}
+
+    # **Fetch: the JSON endpoint if the site has one, otherwise every listing page**
+    started = time.perf_counter()
+    articles = None
+    if site.api:
+        articles = fetch.get_api_articles(site.api.url, site.think_tank, site.api.fields, items_path=site.api.items_path)
+    bodies = []
+    if not articles:
+        for url in (site.url, *site.page_urls):
+            response = fetch.get(url)
+            response.raise_for_status()
+            bodies.append(response.text)
+    timings["fetch"] = time.perf_counter() - started
+
+    # **Parse and extract (skipped when the endpoint already returned articles)**
+    started = time.perf_counter()
+    soups = [parsing.make_soup(body, site._strainer) for body in bodies]
+    timings["parse"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    if not articles:
+        articles = [article for soup in soups for article in engine.select_articles(site, soup)]
+    timings["extract"] = time.perf_counter() - started
+
+    # **Render the Word report**
+    started = time.perf_counter()
+    report.write_report(site.report_heading, articles, os.path.join(workdir, f"{fixtures.slug(site.name)}.docx"))
+    timings["render"] = time.perf_counter() - started
+
+    # **End to end through the engine, with a cold HTTP cache**
+    fetch.CACHE_DIR = tempfile.mkdtemp(dir=workdir)
+    started = time.perf_counter()
+    engine.scrape(site)
+    timings["total"] = time.perf_counter() - started
+
+    return timings, len(articles)
+
+
+def run(site_list, repeat):
+    """
+    Benchmarks each site `repeat` times and returns the median timings per site.
+    """
+    report_rows = {}
+    with tempfile.TemporaryDirectory() as workdir, isolated(workdir):
+        for site in site_list:
+            runs = [run_once(site, workdir) for _ in range(repeat)]
+            row = {stage: statistics.median(timings[stage] for timings, _ in runs) for stage in STAGES}
+            row["articles"] = runs[-1][1]
+            report_rows[site.name] = row
+    return report_rows
+
+
+def print_table(rows):
+    print(f"{'Think tank':<24}" + "".join(f"{stage + ' ms':>12}" for stage in STAGES) + f"{'articles':>10}")
+    for name, row in rows.items():
+        print(f"{name:<24}" + "".join(f"{row[stage] * 1000:>12.1f}" for stage in STAGES) + f"{row['articles']:>10}")
+    totals = {stage: sum(row[stage] for row in rows.values()) for stage in STAGES}
+    print(f"{'All':<24}" + "".join(f"{totals[stage] * 1000:>12.1f}" for stage in STAGES)
+          + f"{sum(row['articles'] for row in rows.values()):>10}")
+
+
+def current_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    """
+    Command line entry point: replays the recorded fixtures and reports per-stage timings.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the scrapers offline against recorded fixtures.")
+    parser.add_argument("think_tanks", nargs="*", metavar="THINK_TANK", help="Think tanks to benchmark (default: all recorded)")
+    parser.add_argument("--dir", default=fixtures.FIXTURE_DIR, help=f"Fixture directory (default: {fixtures.FIXTURE_DIR})")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per site; the median is reported (default: 5)")
+    parser.add_argument("--json", metavar="PATH", help="Also write the results as JSON, e.g. to track them per commit")
+    args = parser.parse_args(argv)
+
+    with fixtures.stand_in_server(args.dir) as base_url:
+        site_list = fixtures.replay_sites(base_url, args.dir, names=args.think_tanks)
+        if not site_list:
+            parser.error(f"no recorded fixtures in {args.dir}; run `python fixtures.py` first")
+        rows = run(site_list, args.repeat)
+
+    print_table(rows)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"commit": current_commit(), "repeat": args.repeat, "sites": rows}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
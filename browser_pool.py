@@ -0,0 +1,213 @@
+import atexit
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import SessionNotCreatedException
+import chromedriver
+import metrics
+
+# **Browser pool settings (override with environment variables)**
+POOL_SIZE = int(os.environ.get("SCRAPER_BROWSER_POOL_SIZE", "2"))
+MAX_PAGES = int(os.environ.get("SCRAPER_BROWSER_MAX_PAGES", "50"))  # Recycle a browser after this many pages
+HEADLESS = os.environ.get("SCRAPER_BROWSER_HEADLESS", "1") != "0"  # Set to 0 to see browser actions
+BLOCK_RESOURCES = os.environ.get("SCRAPER_BROWSER_BLOCK_RESOURCES", "1") != "0"  # Set to 0 to load pages in full
+
+# **Requests the scrapers never need: we only read titles and links out of the DOM**
+BLOCKED_EXTENSIONS = (
+    "png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico",  # Images
+    "woff", "woff2", "ttf", "otf", "eot",  # Fonts
+    "css",  # Stylesheets
+    "mp4", "webm", "mp3",  # Media
+)
+BLOCKED_HOSTS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "googlesyndication.com",
+    "adservice.google.com", "connect.facebook.net", "facebook.com/tr", "hotjar.com",
+    "scorecardresearch.com", "quantserve.com", "chartbeat.com", "chartbeat.net", "parsely.com",
+    "newrelic.com", "nr-data.net", "segment.com", "cdn.cookielaw.org", "addthis.com", "sharethis.com",
+)
+# Network.setBlockedURLs patterns: "*" matches anything, so cover URLs with and without a query string
+BLOCKED_URL_PATTERNS = (
+    [f"*.{ext}" for ext in BLOCKED_EXTENSIONS]
+    + [f"*.{ext}?*" for ext in BLOCKED_EXTENSIONS]
+    + [f"*{host}*" for host in BLOCKED_HOSTS]
+)
+
+
+def launch_driver():
+    """
+    Starts a new Chrome session with the options every scraper shares.
+    """
+    with metrics.span("browser_launch"):
+        return _launch_driver()
+
+
+def _launch_driver():
+    options = Options()
+    if HEADLESS:
+        options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    # Hand the page over once the DOM is parsed instead of waiting for every subresource
+    options.page_load_strategy = "eager"
+    if BLOCK_RESOURCES:
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.media_stream": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+    try:
+        return webdriver.Chrome(service=Service(chromedriver.resolve()), options=options)
+    except SessionNotCreatedException:
+        if chromedriver.OVERRIDE_PATH:
+            raise
+        # The pinned driver no longer matches the installed Chrome, so resolve it again once
+        print("⚠️ Pinned ChromeDriver rejected by Chrome, resolving it again.")
+        chromedriver.forget()
+        return webdriver.Chrome(service=Service(chromedriver.resolve()), options=options)
+
+
+class _Browser:
+    """
+    A warm Chrome session owned by the pool. Jobs only ever see a fresh tab in it.
+    """
+
+    def __init__(self):
+        self.driver = launch_driver()
+        self.base_handle = self.driver.current_window_handle
+        self.pages = 0
+
+    def is_healthy(self):
+        try:
+            return self.base_handle in self.driver.window_handles
+        except Exception:
+            return False
+
+    def open_tab(self):
+        self.driver.switch_to.new_window("tab")
+        if BLOCK_RESOURCES:
+            # Blocking is set per tab, so every new tab needs it before its first navigation
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        return self.driver
+
+    def close_tab(self):
+        driver = self.driver
+        # A new tab starts with one history entry, every navigation adds one more
+        self.pages += max(driver.execute_script("return window.history.length") - 1, 0)
+        for handle in driver.window_handles:
+            if handle != self.base_handle:
+                driver.switch_to.window(handle)
+                driver.close()
+        driver.switch_to.window(self.base_handle)
+        # Don't leak cookies or sessions into the next job
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception as e:
+            print(f"⚠️ Could not close browser cleanly: {e}")
+
+
+class BrowserPool:
+    """
+    Keeps up to `size` Chrome sessions alive and lends them to scrapers one job at a time.
+    """
+
+    def __init__(self, size=POOL_SIZE, max_pages=MAX_PAGES):
+        self._size = size
+        self._max_pages = max_pages
+        self._idle = queue.LifoQueue()  # Reuse the most recently used (warmest) browser first
+        self._slots = threading.BoundedSemaphore(size)
+        self._live = 0  # Browsers running, idle or lent out
+        self._lock = threading.Lock()
+
+    def warm(self):
+        """
+        Launches browsers until the pool is full so the first jobs don't pay for Chrome start-up.
+        Browsers already lent out count towards the pool size.
+        """
+        while (browser := self._launch(limit=self._size)) is not None:
+            self._idle.put(browser)
+
+    @contextmanager
+    def session(self):
+        """
+        Borrows a browser and yields a driver focused on a new tab, returning the browser afterwards.
+        """
+        self._slots.acquire()
+        try:
+            browser = self._checkout()
+            try:
+                yield browser.open_tab()
+            finally:
+                self._checkin(browser)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def _launch(self, limit=None):
+        # Counted before Chrome starts, so warm() and jobs launching at the same time see each other
+        with self._lock:
+            if limit is not None and self._live >= limit:
+                return None
+            self._live += 1
+        try:
+            return _Browser()
+        except Exception:
+            with self._lock:
+                self._live -= 1
+            raise
+
+    def _discard(self, browser):
+        with self._lock:
+            self._live -= 1
+        browser.quit()
+
+    def _checkout(self):
+        while True:
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                return self._launch()
+            if browser.is_healthy():
+                return browser
+            print("⚠️ Discarding unresponsive browser from the pool.")
+            self._discard(browser)
+
+    def _checkin(self, browser):
+        try:
+            browser.close_tab()
+        except Exception as e:
+            print(f"⚠️ Browser failed to reset after job: {e}")
+            self._discard(browser)
+            return
+        if browser.pages >= self._max_pages or not browser.is_healthy():
+            self._discard(browser)
+            return
+        # A job that found no idle browser while warm() was still filling the pool launched an
+        # extra one, so quit anything beyond `size` instead of keeping it idle forever
+        with self._lock:
+            surplus = self._live > self._size
+            if surplus:
+                self._live -= 1
+        if surplus:
+            browser.quit()
+            return
+        self._idle.put(browser)
+
+
+pool = BrowserPool()
+session = pool.session
+
+atexit.register(pool.close)
@@ -0,0 +1,66 @@
+import os
+import threading
+from webdriver_manager.chrome import ChromeDriverManager
+
+# **ChromeDriver location settings**
+# CHROMEDRIVER_PATH pins the binary outright (e.g. on air-gapped machines) and skips any lookup.
+OVERRIDE_PATH = os.environ.get("CHROMEDRIVER_PATH")
+CACHE_FILE = os.environ.get(
+    "SCRAPER_CHROMEDRIVER_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "flask-scraper-app", "chromedriver-path"),
+)
+
+_resolved_path = None
+_lock = threading.Lock()
+
+
+def resolve():
+    """
+    Returns the ChromeDriver binary path, resolving it at most once per host.
+    """
+    global _resolved_path
+    if OVERRIDE_PATH:
+        if not _is_executable(OVERRIDE_PATH):
+            raise FileNotFoundError(f"CHROMEDRIVER_PATH is not an executable file: {OVERRIDE_PATH}")
+        return OVERRIDE_PATH
+
+    with _lock:
+        if _resolved_path is None:
+            _resolved_path = _read_cached_path() or _install()
+        return _resolved_path
+
+
+def forget():
+    """
+    Drops the pinned path so the next resolve() asks webdriver_manager again (e.g. after a Chrome upgrade).
+    """
+    global _resolved_path
+    with _lock:
+        _resolved_path = None
+        if os.path.exists(CACHE_FILE):
+            os.remove(CACHE_FILE)
+
+
+def _read_cached_path():
+    try:
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            path = f.read().strip()
+    except OSError:
+        return None
+    return path if _is_executable(path) else None
+
+
+def _install():
+    path = ChromeDriverManager().install()
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            f.write(path)
+    except OSError as e:
+        print(f"⚠️ Could not persist ChromeDriver path to {CACHE_FILE}: {e}")
+    print(f"✅ ChromeDriver resolved: {path}")
+    return path
+
+
+def _is_executable(path):
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
@@ -0,0 +1,40 @@
+import os
+import metrics
+import registry
+import report
+import results
+import sweep
+
+DIGEST_PATH = os.path.join(results.OUTPUT_FOLDER, "Think Tank Digest.docx")
+
+
+def is_fresh():
+    """
+    True when every think tank has a fresh report, so the digest can be built without scraping.
+    """
+    return all(results.fresh_report(think_tank) for think_tank in registry.SCRAPERS)
+
+
+def build_digest(progress=None, force=False, refresh=True):
+    """
+    Refreshes stale think tanks in parallel, then writes one document with a section per think tank.
+    With `refresh` off the last reports are used as they are, so nothing is scraped.
+    """
+    if refresh:
+        progress = progress if progress is not None else sweep.new_progress(registry.SCRAPERS.keys())
+        sweep.run_all(progress, force)
+
+    # Label the digest's render span instead of leaving its think tank empty
+    with metrics.scraping("digest"):
+        return report.write_sections_streaming(_sections(), DIGEST_PATH)
+
+
+def _sections():
+    # Loaded one think tank at a time as the writer asks for them, so memory stays flat
+    for think_tank in registry.SCRAPERS:
+        # A failed refresh still falls back to the last report the think tank produced
+        snapshot = results.load_articles(think_tank)
+        if snapshot is None:
+            print(f"⚠️ Leaving {think_tank} out of the digest: no results available.")
+            continue
+        yield snapshot
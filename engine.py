@@ -0,0 +1,229 @@
+import argparse
+import functools
+from urllib.parse import urljoin
+from selenium.webdriver.common.by import By
+import browser_pool
+import waits
+import fetch
+import parsing
+import ratelimit
+import exports
+import metrics
+import report
+import results
+import store
+import sites
+
+
+def extract_articles(site, html):
+    """
+    Pulls the articles out of one listing page's HTML using the site's selectors.
+    """
+    with metrics.span("parse"):
+        soup = parsing.make_soup(html, site._strainer)
+    with metrics.span("extract"):
+        return select_articles(site, soup)
+
+
+def select_articles(site, soup):
+    """
+    Turns each item matched in an already parsed listing into an article.
+    """
+    articles = []
+    for item in site._item.select(soup, limit=site.limit or 0):
+        # **Find the article link**
+        if site.link_in_parent:
+            a_tag = item.find_parent("a", href=True)
+        elif site._link:
+            a_tag = site._link.select_one(item)
+        else:
+            a_tag = item
+        if a_tag is None or not a_tag.get("href"):
+            continue
+
+        # **Find the title, falling back to the link's text**
+        title_tag = site._title.select_one(item) if site._title else (a_tag if site._link else item)
+        title = title_tag.get_text(strip=True) if title_tag else ""
+        if not title:
+            continue
+
+        article = {"Think Tank": site.think_tank, "Title": title, "URL": urljoin(site.link_base, a_tag["href"])}
+        if site._date:
+            date_tag = site._date.select_one(item)
+            article["Date"] = date_tag.get_text(strip=True) if date_tag else "No Date"
+        articles.append(article)
+
+    return articles
+
+
+def scrape_with_http(site):
+    """
+    Fetches all of the site's listing pages in one parallel round and returns their
+    articles, or None if any page failed or came back without a listing.
+    """
+    extract = functools.partial(extract_articles, site)
+    urls = (site.url, *site.page_urls)
+    pages = []
+
+    # In incremental mode, page 1 decides whether the further pages are worth fetching
+    if store.INCREMENTAL and site.page_urls:
+        pages = fetch.get_pages(urls[:1], extract)
+        if pages[0] and store.only_known(pages[0]):
+            print(f"✅ No new {site.think_tank} articles on page 1, skipping the rest.")
+            return with_earlier_pages(site, pages[0])
+        urls = urls[1:]
+
+    pages += fetch.get_pages(urls, extract)
+    if site.browser and not all(pages):
+        return None
+    if any(page is None for page in pages):
+        raise RuntimeError(f"Failed to fetch {site.think_tank} page.")
+    return [article for page in pages for article in page]
+
+
+def scrape_with_browser(site):
+    """
+    Loads the listing in a pooled Chrome tab, pressing "show more" or clicking through
+    further pages as the site's spec asks.
+    """
+    # The tab counts against the site's concurrency, and every navigation against its rate limit
+    with browser_pool.session() as driver, ratelimit.limited(site.url):
+        # **Open the listing and wait until the articles have loaded**
+        with metrics.span("browser_wait"):
+            driver.get(site.url)
+            waits.wait_for_articles(driver, site.wait_selector, timeout=site.wait_timeout)
+
+        stopped_early = False
+
+        # **Press "Show More" to append older articles**
+        if site.show_more:
+            seen = 0
+            for _ in range(site.show_more_clicks):
+                # In incremental mode, stop as soon as the last batch has nothing we haven't seen before
+                if store.INCREMENTAL:
+                    loaded = extract_articles(site, driver.page_source)
+                    if store.only_known(loaded[seen:]):
+                        print(f"✅ No new {site.think_tank} articles in the last batch, not loading more.")
+                        stopped_early = True
+                        break
+                    seen = len(loaded)
+                try:
+                    show_more_button = driver.find_element(By.CSS_SELECTOR, site.show_more)
+                    ratelimit.wait(site.url)
+                    with metrics.span("browser_wait"):
+                        waits.click_and_wait(driver, show_more_button, site.wait_selector, timeout=site.wait_timeout)
+                except Exception:
+                    print("⚠️ 'Show More' button not found or already gone.")
+                    break
+
+        page = extract_articles(site, driver.page_source)
+        articles = list(page)
+
+        # **Click through to the next pages**
+        for page_number, xpath in enumerate(site.next_pages, start=2):
+            # In incremental mode, stop as soon as a page has nothing we haven't seen before
+            if store.INCREMENTAL and store.only_known(page):
+                print(f"✅ No new articles on page {page_number - 1}, skipping the rest.")
+                stopped_early = True
+                break
+            try:
+                page_button = driver.find_element(By.XPATH, xpath)
+                ratelimit.wait(site.url)
+                with metrics.span("browser_wait"):
+                    waits.click_and_wait(driver, page_button, site.wait_selector, timeout=site.wait_timeout)
+                page = extract_articles(site, driver.page_source)
+                articles.extend(page)
+                print(f"✅ Scraped page {page_number}")
+            except Exception as e:
+                print(f"⚠️ Page {page_number} button not found: {e}. Skipping.")
+                page = []
+
+    return with_earlier_pages(site, articles) if stopped_early else articles
+
+
+def with_earlier_pages(site, articles):
+    """
+    Completes a listing whose pagination stopped early in incremental mode with the rest of
+    the site's last report, so the report keeps the older pages this run didn't fetch.
+    """
+    snapshot = results.load_articles(site.name)
+    if snapshot is None:
+        return articles
+    _, last_articles = snapshot
+    fetched = {article["URL"] for article in articles}
+    earlier = [article for article in last_articles if article["URL"] not in fetched]
+    return articles + earlier[:max(len(last_articles) - len(articles), 0)]
+
+
+def collect_articles(site):
+    """
+    Gets the site's articles the cheapest way its spec allows: JSON endpoint, then plain
+    HTTP, then the browser.
+    """
+    if site.api:
+        articles = fetch.get_api_articles(
+            site.api.url, site.think_tank, site.api.fields, params=site.api.params, items_path=site.api.items_path
+        )
+        if articles:
+            return articles
+        print(f"⚠️ {site.think_tank} endpoint unavailable, falling back to the listing page.")
+
+    if site.http:
+        articles = scrape_with_http(site)
+        if articles is not None:
+            return articles
+        print(f"⚠️ {site.think_tank} listing pages not available over HTTP, using the browser.")
+
+    return scrape_with_browser(site)
+
+
+def scrape(site):
+    """
+    Scrapes one site and writes its Word report, returning the report's path.
+    """
+    with metrics.scraping(site.name):
+        return _scrape(site)
+
+
+def _scrape(site):
+    articles = collect_articles(site)
+    metrics.ARTICLES_FOUND.inc(len(articles))
+
+    # **Save results to CSV (only when CSV export is enabled)**
+    if articles:
+        exports.write_csv(articles, site.csv_filename)
+        print(f"✅ {len(articles)} {site.think_tank} articles scraped.")
+    else:
+        print(f"⚠️ No articles found on {site.think_tank}'s page.")
+
+    # **Record the articles in the local article store**
+    store.upsert_articles(site.name, articles)
+
+    # **Create the Word document with hyperlinked titles**
+    return report.write_report(site.report_heading, articles, results.report_path(site.name))
+
+
+def main(argv=None):
+    """
+    Command line entry point: scrapes the named think tanks (all of them by default).
+    """
+    by_name = {site.name: site for site in sites.SITES}
+    parser = argparse.ArgumentParser(description="Scrape think tank research listings into Word reports.")
+    parser.add_argument("think_tanks", nargs="*", metavar="THINK_TANK", help="Think tank names as listed by --list")
+    parser.add_argument("--list", action="store_true", help="List the available think tanks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(by_name))
+        return
+
+    unknown = [name for name in args.think_tanks if name not in by_name]
+    if unknown:
+        parser.error(f"unknown think tank(s): {', '.join(unknown)}")
+
+    for name in args.think_tanks or by_name:
+        scrape(by_name[name])
+
+
+if __name__ == "__main__":
+    main()
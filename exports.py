@@ -0,0 +1,19 @@
+import csv
+import os
+
+# **CSV export is off by default; set SCRAPER_EXPORT_CSV=1 to keep a CSV copy of every run**
+EXPORT_CSV = os.environ.get("SCRAPER_EXPORT_CSV") == "1"
+FIELDS = ["Think Tank", "Date", "Title", "URL"]
+
+
+def write_csv(articles, filename):
+    """
+    Writes the scraped articles to a CSV file if CSV export is enabled.
+    """
+    if not EXPORT_CSV:
+        return
+    with open(filename, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(articles)
+    print(f"✅ Articles saved to {filename}")
@@ -0,0 +1,221 @@
+import contextvars
+import hashlib
+import html
+import inspect
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+import metrics
+import ratelimit
+
+# **HTTP client settings (override with environment variables)**
+CONNECT_TIMEOUT = float(os.environ.get("SCRAPER_HTTP_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.environ.get("SCRAPER_HTTP_READ_TIMEOUT", "20"))
+MAX_PER_HOST = int(os.environ.get("SCRAPER_HTTP_MAX_PER_HOST", "4"))  # Open connections kept per host
+RETRIES = int(os.environ.get("SCRAPER_HTTP_RETRIES", "3"))
+CACHE_DIR = os.environ.get("SCRAPER_HTTP_CACHE_DIR", ".http_cache")  # Listing pages kept for conditional GETs
+
+# ACCEPT_ENCODING only advertises brotli when a decoder for it is installed
+HEADERS = {"User-Agent": "Mozilla/5.0", "Accept-Encoding": ACCEPT_ENCODING}
+
+
+def _build_session():
+    retry = Retry(
+        total=RETRIES,
+        backoff_factor=0.5,  # 0.5 s, 1 s, 2 s ...
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+        respect_retry_after_header=True,
+        raise_on_status=False,  # Hand the last response back so callers can check status_code
+    )
+    # pool_block makes MAX_PER_HOST a hard limit instead of opening throwaway connections
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=MAX_PER_HOST, pool_block=True, max_retries=retry)
+
+    s = requests.Session()
+    s.headers.update(HEADERS)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+# Process-wide client so every static-HTML scraper reuses the same keep-alive connections
+session = _build_session()
+
+
+def get(url, **kwargs):
+    """
+    GETs a URL through the shared session with the default timeouts and retries,
+    within the host's rate limit (see ratelimit.py).
+    """
+    kwargs.setdefault("timeout", (CONNECT_TIMEOUT, READ_TIMEOUT))
+    with ratelimit.limited(url):
+        # Timed after the limiter lets us through, so politeness waits only count as rate_limit
+        with metrics.span("fetch"):
+            response = session.get(url, **kwargs)
+    if response.status_code in (429, 503):
+        # Still throttled after urllib3's retries: hold back every other request to this host too
+        ratelimit.back_off(url, response.headers.get("Retry-After"))
+    return response
+
+
+def get_articles(url, extract):
+    """
+    Fetches a listing page with a conditional GET and returns (response, articles).
+
+    The body, its validators (ETag / Last-Modified) and the articles `extract` pulled out of
+    it are cached on disk. When the server answers 304 the cached articles are returned
+    without parsing anything. `articles` is None if the page could not be fetched.
+    """
+    entry = _load_cache_entry(url)
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = get(url, headers=headers)
+
+    if response.status_code == 304 and "body" in entry:
+        # Unchanged page: only re-parse if the extractor changed since the articles were cached
+        if entry.get("extractor") == _extractor_key(extract):
+            metrics.CACHE_HITS.inc(cache="http")
+            return response, entry["articles"]
+        articles = extract(entry["body"])
+    elif response.status_code == 200:
+        entry = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "body": response.text,
+        }
+        articles = extract(entry["body"])
+    else:
+        return response, None
+
+    entry["extractor"] = _extractor_key(extract)
+    entry["articles"] = articles
+    _save_cache_entry(url, entry)
+    return response, articles
+
+
+def get_pages(urls, extract):
+    """
+    Fetches several listing pages at once (e.g. pages 1..N of a paginated listing) and
+    returns their articles in the same order. A page that could not be fetched is None.
+    """
+    def fetch_page(url):
+        try:
+            response, articles = get_articles(url, extract)
+        except requests.RequestException as e:
+            print(f"⚠️ Could not fetch {url}: {e}")
+            return None
+        if articles is None:
+            print(f"⚠️ Could not fetch {url}: {response.status_code}")
+        return articles
+
+    # Run each page in a copy of the caller's context so metrics keep the think tank label
+    context = contextvars.copy_context()
+
+    # The per-host connection pool already caps how many of these hit the same site at once
+    with ThreadPoolExecutor(max_workers=MAX_PER_HOST, thread_name_prefix="fetch") as executor:
+        return list(executor.map(lambda url: context.copy().run(fetch_page, url), urls))
+
+
+def get_api_articles(url, think_tank, fields, params=None, items_path=None):
+    """
+    Reads a listing straight from the JSON endpoint that fills it in the browser, and
+    returns the articles or None if the endpoint could not be used.
+
+    `fields` maps article keys to dotted paths inside each item, e.g. for WordPress
+    {"Title": "title.rendered", "URL": "link"}. `items_path` points at the list of items
+    when the response wraps it in an object.
+    """
+    try:
+        response = get(url, params=params, headers={"Accept": "application/json"})
+        response.raise_for_status()
+        items = _lookup(response.json(), items_path)
+    except (requests.RequestException, ValueError, KeyError, TypeError) as e:
+        print(f"⚠️ Could not read {think_tank} endpoint {url}: {e}")
+        return None
+    if not isinstance(items, list):
+        print(f"⚠️ Unexpected response from {think_tank} endpoint {url}.")
+        return None
+
+    articles = []
+    for item in items:
+        article = {"Think Tank": think_tank}
+        for key, path in fields.items():
+            try:
+                article[key] = _plain_text(_lookup(item, path))
+            except (KeyError, TypeError, IndexError):
+                article[key] = f"No {key}"
+        articles.append(article)
+    return articles
+
+
+def _lookup(value, path):
+    # Follows a dotted path such as "title.rendered" (or "results.0.url") into decoded JSON
+    for key in path.split(".") if path else ():
+        value = value[int(key)] if isinstance(value, list) else value[key]
+    return value
+
+
+def _plain_text(value):
+    # APIs often return titles as rendered HTML ("Trade &#8217;s <em>future</em>")
+    return html.unescape(re.sub(r"<[^>]+>", "", str(value))).strip()
+
+
+def _cache_path(url):
+    return os.path.join(CACHE_DIR, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def _extractor_key(extract):
+    # Changes whenever the extraction code, the helpers from its own module that it calls
+    # (e.g. engine.select_articles) or the site spec it is bound to is edited,
+    # so stale cached articles are never reused
+    func = getattr(extract, "func", extract)  # Unwrap functools.partial
+    helpers = [
+        helper for name in func.__code__.co_names
+        if inspect.isfunction(helper := func.__globals__.get(name)) and helper.__module__ == func.__module__
+    ]
+    digest = hashlib.sha256(repr(getattr(extract, "args", ())).encode("utf-8"))
+    for code in [func.__code__] + [helper.__code__ for helper in helpers]:
+        _hash_code(digest, code)
+    return digest.hexdigest()
+
+
+def _hash_code(digest, code):
+    # Nested code objects (comprehensions, lambdas) are hashed by content, not by their repr's address
+    digest.update(code.co_code)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            _hash_code(digest, const)
+        else:
+            digest.update(repr(const).encode("utf-8"))
+
+
+def _load_cache_entry(url):
+    try:
+        with open(_cache_path(url), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache_entry(url, entry):
+    if not (entry.get("etag") or entry.get("last_modified")):
+        return  # Nothing to revalidate with, so caching the page would never pay off
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write to a temp file first so concurrent readers never see a half-written entry
+        tmp_path = f"{_cache_path(url)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, _cache_path(url))
+    except OSError as e:
+        print(f"⚠️ Could not cache {url}: {e}")
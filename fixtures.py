@@ -0,0 +1,171 @@
+import argparse
+import dataclasses
+import functools
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import browser_pool
+import fetch
+import sites
+import waits
+
+# **Fixture settings (override with environment variables)**
+FIXTURE_DIR = os.environ.get("SCRAPER_FIXTURE_DIR", "fixtures")  # Checked in, so each commit has its own copy
+FORMAT_VERSION = 1
+MANIFEST = "manifest.json"
+
+
+def slug(name):
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def load_manifest(fixture_dir=FIXTURE_DIR):
+    """
+    Returns the manifest of recorded sites, or an empty one if nothing has been recorded yet.
+    """
+    try:
+        with open(os.path.join(fixture_dir, MANIFEST), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {"format": FORMAT_VERSION, "sites": {}}
+    if manifest.get("format") != FORMAT_VERSION:
+        raise ValueError(f"Fixtures in {fixture_dir} use format {manifest.get('format')}, expected {FORMAT_VERSION}.")
+    return manifest
+
+
+def record(site, fixture_dir=FIXTURE_DIR):
+    """
+    Captures what the engine would read for `site`: its JSON endpoint, its listing pages
+    over HTTP and, for browser sites, the rendered page source. Returns the manifest entry.
+    """
+    site_dir = os.path.join(fixture_dir, slug(site.name))
+    os.makedirs(site_dir, exist_ok=True)
+    entry = {"recorded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), "api": None, "pages": [], "rendered": False}
+
+    # **JSON endpoint**
+    if site.api:
+        response = fetch.get(site.api.url, params=site.api.params, headers={"Accept": "application/json"})
+        if response.status_code == 200:
+            entry["api"] = _write(site_dir, "api.json", response.text)
+
+    # **Listing pages over plain HTTP**
+    if site.http:
+        for number, url in enumerate((site.url, *site.page_urls), start=1):
+            response = fetch.get(url)
+            if response.status_code != 200:
+                print(f"⚠️ {site.name} page {number} answered {response.status_code}, not recorded.")
+                entry["pages"] = []
+                break
+            entry["pages"].append(_write(site_dir, f"page-{number}.html", response.text))
+
+    # **Rendered page source, for sites the engine would otherwise open in Chrome**
+    if site.browser and not entry["pages"]:
+        with browser_pool.session() as driver:
+            driver.get(site.url)
+            waits.wait_for_articles(driver, site.wait_selector, timeout=site.wait_timeout)
+            entry["pages"] = [_write(site_dir, "page-1.html", driver.page_source)]
+            entry["rendered"] = True
+
+    print(f"✅ Recorded {site.name}: {len(entry['pages'])} page(s){' + endpoint' if entry['api'] else ''}.")
+    return entry
+
+
+def record_all(site_list, fixture_dir=FIXTURE_DIR):
+    """
+    Records each site and rewrites the manifest, keeping entries for sites not recorded this time.
+    """
+    os.makedirs(fixture_dir, exist_ok=True)
+    manifest = load_manifest(fixture_dir)
+    for site in site_list:
+        try:
+            manifest["sites"][site.name] = record(site, fixture_dir)
+        except Exception as e:
+            print(f"❌ Could not record {site.name}: {e}")
+    manifest["format"] = FORMAT_VERSION
+    with open(os.path.join(fixture_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def stand_in_server(fixture_dir=FIXTURE_DIR):
+    """
+    Serves the fixture directory on a free local port and yields its base URL.
+    """
+    handler = functools.partial(_QuietHandler, directory=fixture_dir)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def replay_site(site, entry, base_url):
+    """
+    Returns a copy of `site` that reads its recorded responses from the stand-in server.
+    Rendered pages are served as plain HTML, so replays never need Chrome. Links still
+    resolve against the live site, so replayed articles match recorded ones.
+    """
+    site_url = f"{base_url}/{slug(site.name)}"
+    api = dataclasses.replace(site.api, url=f"{site_url}/{entry['api']}", params=None) if entry["api"] else None
+    pages = [f"{site_url}/{page}" for page in entry["pages"]]
+    return dataclasses.replace(
+        site,
+        url=pages[0] if pages else site_url,
+        page_urls=tuple(pages[1:]),
+        base_url=site.link_base,
+        api=api,
+        http=bool(pages),
+        browser=False,
+    )
+
+
+def replay_sites(base_url, fixture_dir=FIXTURE_DIR, names=None):
+    """
+    Returns replay copies of every recorded site (or just `names`), in sites.SITES order.
+    Sites whose listing pages could not be recorded are left out.
+    """
+    recorded = load_manifest(fixture_dir)["sites"]
+    return [
+        replay_site(site, recorded[site.name], base_url)
+        for site in sites.SITES
+        if recorded.get(site.name, {}).get("pages") and (not names or site.name in names)
+    ]
+
+
+def main(argv=None):
+    """
+    Command line entry point: records the named think tanks (all of them by default).
+    """
+    parser = argparse.ArgumentParser(description="Record live listing responses as offline fixtures.")
+    parser.add_argument("think_tanks", nargs="*", metavar="THINK_TANK", help="Think tanks to record (default: all)")
+    parser.add_argument("--dir", default=FIXTURE_DIR, help=f"Fixture directory (default: {FIXTURE_DIR})")
+    args = parser.parse_args(argv)
+
+    by_name = {site.name: site for site in sites.SITES}
+    unknown = [name for name in args.think_tanks if name not in by_name]
+    if unknown:
+        parser.error(f"unknown think tank(s): {', '.join(unknown)}")
+    record_all([by_name[name] for name in args.think_tanks or by_name], args.dir)
+
+
+def _write(site_dir, filename, text):
+    with open(os.path.join(site_dir, filename), "w", encoding="utf-8") as f:
+        f.write(text)
+    return filename
+
+
+if __name__ == "__main__":
+    main()
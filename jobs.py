@@ -0,0 +1,109 @@
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# **Job queue settings (override with environment variables)**
+MAX_WORKERS = int(os.environ.get("SCRAPER_MAX_WORKERS", "4"))
+JOB_RETENTION = int(os.environ.get("SCRAPER_JOB_RETENTION", "3600"))  # Seconds to keep finished jobs
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class Job:
+    """
+    A single scraper run tracked by the queue.
+    """
+
+    def __init__(self, think_tank):
+        self.id = uuid.uuid4().hex
+        self.think_tank = think_tank
+        self.status = QUEUED
+        self.result = None  # Path to the generated Word file (or paths per site for sweeps)
+        self.error = None
+        self.progress = None  # Per-site status table for multi-site jobs
+        self.created_at = time.time()
+        self.finished_at = None
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "think_tank": self.think_tank,
+            "status": self.status,
+            "error": self.error,
+            "progress": self.progress,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobQueue:
+    """
+    Runs scraper jobs on a bounded pool of worker threads so requests return immediately.
+    """
+
+    def __init__(self, max_workers=MAX_WORKERS, retention=JOB_RETENTION):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scraper")
+        self._retention = retention
+        self._jobs = {}
+        self._active = {}  # Key -> queued or running job, so duplicate submissions share it
+        self._lock = threading.Lock()
+
+    def submit(self, think_tank, func, *args, key=None):
+        """
+        Queues func(*args). If `key` is given and a job with the same key is still
+        queued or running, that job is returned instead of starting another.
+        """
+        with self._lock:
+            self._prune()
+            if key is not None and key in self._active:
+                return self._active[key]
+            job = Job(think_tank)
+            self._jobs[job.id] = job
+            if key is not None:
+                self._active[key] = job
+        self._executor.submit(self._run, job, func, args, key)
+        return job
+
+    def completed(self, think_tank, result):
+        """
+        Records a job that was answered from cache without running anything.
+        """
+        job = Job(think_tank)
+        job.status = DONE
+        job.result = result
+        job.finished_at = job.created_at
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job, func, args, key):
+        job.status = RUNNING
+        try:
+            job.result = func(*args)
+            job.status = DONE
+        except Exception as e:
+            print(f"❌ Job {job.id} ({job.think_tank}) failed: {e}")
+            job.error = str(e)
+            job.status = FAILED
+        finally:
+            job.finished_at = time.time()
+            if key is not None:
+                with self._lock:
+                    self._active.pop(key, None)
+
+    def _prune(self):
+        # Forget finished jobs older than the retention window
+        cutoff = time.time() - self._retention
+        expired = [job_id for job_id, job in self._jobs.items() if job.finished_at and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
@@ -0,0 +1,141 @@
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bounds (seconds) of the stage histogram buckets: from a cached parse up to a slow Chrome page
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+# Think tank the current code is working for. Context variables follow asyncio.to_thread
+# and are copied into fetch's worker threads, so spans deep inside fetch or report get it too.
+_think_tank = contextvars.ContextVar("think_tank", default="")
+
+_registry = []
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, help, labels):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def _key(self, labels):
+        # think_tank defaults to whichever think tank is being scraped in this context
+        if "think_tank" in self.labels and "think_tank" not in labels:
+            labels = {**labels, "think_tank": _think_tank.get()}
+        return tuple(str(labels[label]) for label in self.labels)
+
+    def _label_text(self, key, extra=()):
+        pairs = list(zip(self.labels, key)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{label}="{_escape(value)}"' for label, value in pairs) + "}"
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            for key in sorted(self._values):
+                lines.extend(self._render_value(key, self._values[key]))
+        return lines
+
+
+class Counter(_Metric):
+    """
+    A monotonically increasing count, e.g. articles found per think tank.
+    """
+
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _render_value(self, key, value):
+        return [f"{self.name}{self._label_text(key)} {value}"]
+
+
+class Histogram(_Metric):
+    """
+    Observed durations bucketed by BUCKETS, with their running sum and count.
+    """
+
+    kind = "histogram"
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key, ([0] * len(BUCKETS), 0.0, 0))
+            for i, bound in enumerate(BUCKETS):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def _render_value(self, key, value):
+        counts, total, count = value
+        lines = [
+            f"{self.name}_bucket{self._label_text(key, [('le', bound)])} {bucket_count}"
+            for bound, bucket_count in zip(BUCKETS, counts)
+        ]
+        lines.append(f"{self.name}_bucket{self._label_text(key, [('le', '+Inf')])} {count}")
+        lines.append(f"{self.name}_sum{self._label_text(key)} {total}")
+        lines.append(f"{self.name}_count{self._label_text(key)} {count}")
+        return lines
+
+
+# **Metrics exported at /metrics**
+STAGE_SECONDS = Histogram(
+    "scraper_stage_seconds",
+    "Time spent in each stage of a scrape (fetch, rate_limit, browser_launch, browser_wait, parse, extract, render, save).",
+    ("stage", "think_tank"),
+)
+ARTICLES_FOUND = Counter("scraper_articles_found_total", "Articles returned by scrapes.", ("think_tank",))
+FAILURES = Counter("scraper_failures_total", "Scrapes that raised an error.", ("think_tank",))
+CACHE_HITS = Counter(
+    "scraper_cache_hits_total",
+    "Work skipped thanks to a cache: a fresh report (report) or an unchanged listing page (http).",
+    ("think_tank", "cache"),
+)
+
+
+@contextmanager
+def scraping(think_tank):
+    """
+    Labels every span and counter recorded inside the block with `think_tank`.
+    """
+    token = _think_tank.set(think_tank)
+    try:
+        yield
+    finally:
+        _think_tank.reset(token)
+
+
+@contextmanager
+def span(stage):
+    """
+    Times the block and records it under `stage` for the current think tank, even if it raises.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage=stage)
+
+
+def render():
+    """
+    Returns every metric in the Prometheus text exposition format.
+    """
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,12 @@
+from bs4 import BeautifulSoup
+
+# lxml is several times faster than the pure-Python "html.parser" on large listing pages
+PARSER = "lxml"
+
+
+def make_soup(html, only=None):
+    """
+    Parses HTML with lxml. When a SoupStrainer is passed as `only`, just the matching
+    tags (and their children) are built into the tree and the rest of the page is skipped.
+    """
+    return BeautifulSoup(html, PARSER, parse_only=only)
@@ -0,0 +1,137 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+import metrics
+
+# **Politeness defaults per host (override with environment variables)**
+RATE = float(os.environ.get("SCRAPER_RATE_PER_HOST", "2"))  # Requests per second, 0 disables rate limiting
+BURST = int(os.environ.get("SCRAPER_RATE_BURST", "4"))  # Requests allowed back to back before the rate applies
+CONCURRENCY = int(os.environ.get("SCRAPER_HOST_CONCURRENCY", "4"))  # Requests in flight per host
+BACK_OFF = float(os.environ.get("SCRAPER_RATE_BACK_OFF", "30"))  # Pause after a 429/503 without Retry-After
+
+
+class TokenBucket:
+    """
+    Allows `rate` requests per second on average with bursts of up to `burst`.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Blocks until a request may be sent.
+        """
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                delay = self._paused_until - now
+                if delay <= 0 and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                if delay <= 0:
+                    delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+    def pause(self, seconds):
+        """
+        Holds back every request for `seconds`, e.g. after the host asked us to slow down.
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+
+class _Host:
+    def __init__(self, rate, burst, concurrency):
+        self.bucket = TokenBucket(rate, burst)
+        self.slots = threading.BoundedSemaphore(concurrency)
+
+
+_settings = {}  # Host -> (rate, burst, concurrency) set by configure()
+_hosts = {}
+_lock = threading.Lock()
+
+
+def host_of(url):
+    return (urlsplit(url).hostname or "").lower()
+
+
+def configure(host, crawl_delay=None, concurrency=None):
+    """
+    Overrides the defaults for one host: at most one request every `crawl_delay` seconds
+    and at most `concurrency` requests in flight. Takes effect for hosts not used yet.
+    """
+    rate, burst = (1 / crawl_delay, 1) if crawl_delay else (RATE, BURST)
+    with _lock:
+        _settings[host.lower()] = (rate, burst, concurrency or CONCURRENCY)
+
+
+def _host(url):
+    host = host_of(url)
+    with _lock:
+        state = _hosts.get(host)
+        if state is None:
+            state = _hosts[host] = _Host(*_settings.get(host, (RATE, BURST, CONCURRENCY)))
+        return state
+
+
+def wait(url):
+    """
+    Blocks until the rate limit of the URL's host allows another request.
+    """
+    with metrics.span("rate_limit"):
+        _host(url).bucket.acquire()
+
+
+@contextmanager
+def limited(url):
+    """
+    Holds one of the host's concurrency slots for the block, entered once the rate limit allows.
+    """
+    state = _host(url)
+    with metrics.span("rate_limit"):
+        state.slots.acquire()
+        try:
+            state.bucket.acquire()
+        except BaseException:
+            state.slots.release()
+            raise
+    try:
+        yield
+    finally:
+        state.slots.release()
+
+
+def back_off(url, retry_after=None):
+    """
+    Pauses the URL's host after it answered 429 or 503, honouring Retry-After (in seconds) if sent.
+    """
+    try:
+        seconds = float(retry_after)
+    except (TypeError, ValueError):
+        seconds = BACK_OFF
+    print(f"⚠️ {host_of(url)} asked us to slow down, pausing it for {seconds:.0f}s.")
+    _host(url).bucket.pause(seconds)
+
+
+def configure_site(site):
+    """
+    Applies a site spec's crawl_delay and concurrency to every host the site is fetched from.
+    """
+    if not (site.crawl_delay or site.concurrency):
+        return
+    urls = [site.url, *site.page_urls] + ([site.api.url] if site.api else [])
+    for host in {host_of(url) for url in urls}:
+        configure(host, crawl_delay=site.crawl_delay, concurrency=site.concurrency)
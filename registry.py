@@ -0,0 +1,40 @@
+import importlib
+import sites
+
+# Dictionary mapping think tanks to their site specs (see sites.py)
+SCRAPERS = {site.name: site for site in sites.SITES}
+
+# Scrapers that always drive Chrome and so must wait for the browser pool. Sites that only fall
+# back to Chrome take a browser slot inside browser_pool.session when they actually need one.
+BROWSER_SCRAPERS = {site.name for site in sites.SITES if site.browser and not (site.http or site.api)}
+
+
+def get_scraper(think_tank):
+    """
+    Returns a zero-argument callable that scrapes the think tank, importing the engine on first use.
+    """
+    engine = importlib.import_module("engine")
+    site = SCRAPERS[think_tank]
+    return lambda: engine.scrape(site)
+
+
+def uses_browser(think_tank):
+    return think_tank in BROWSER_SCRAPERS
+
+
+def run(think_tank):
+    """
+    Runs a think tank's scraper in-process and returns the path of its Word report.
+    """
+    return get_scraper(think_tank)()
+
+
+def preload():
+    """
+    Imports the scraping engine (Selenium, lxml, python-docx) up front so the first request
+    doesn't pay the import cost.
+    """
+    try:
+        importlib.import_module("engine")
+    except Exception as e:
+        print(f"⚠️ Could not load the scraping engine: {e}")
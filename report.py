@@ -0,0 +1,219 @@
+import copy
+import functools
+import io
+import json
+import os
+import re
+import tempfile
+import threading
+import zipfile
+from xml.sax.saxutils import escape, quoteattr
+from docx import Document  # For Word document creation
+from docx.opc.constants import RELATIONSHIP_TYPE
+from docx.oxml import OxmlElement, ns
+import metrics
+
+
+def _hyperlink_run_properties():
+    """
+    Builds the run formatting shared by every hyperlink: Calibri, 13.5 pt, underlined, blue.
+    """
+    rPr = OxmlElement("w:rPr")
+
+    rFonts = OxmlElement("w:rFonts")
+    rFonts.set(ns.qn("w:ascii"), "Calibri")
+    rFonts.set(ns.qn("w:hAnsi"), "Calibri")
+
+    sz = OxmlElement("w:sz")
+    sz.set(ns.qn("w:val"), "27")  # 13.5 pt (size * 2)
+
+    u = OxmlElement("w:u")
+    u.set(ns.qn("w:val"), "single")  # Underlined
+
+    color = OxmlElement("w:color")
+    color.set(ns.qn("w:val"), "0000FF")  # Blue (Accent 1)
+
+    rPr.append(rFonts)
+    rPr.append(sz)
+    rPr.append(u)
+    rPr.append(color)
+    return rPr
+
+
+# Built once and cloned for each link instead of rebuilding four elements per row
+HYPERLINK_RUN_PROPERTIES = _hyperlink_run_properties()
+
+
+def add_hyperlink(paragraph, text, url):
+    """
+    Adds a real clickable hyperlink to a Word document with specific formatting.
+    """
+    r_id = paragraph.part.relate_to(url, RELATIONSHIP_TYPE.HYPERLINK, is_external=True)
+
+    hyperlink = OxmlElement("w:hyperlink")
+    hyperlink.set(ns.qn("r:id"), r_id)
+
+    r = OxmlElement("w:r")
+    r.append(copy.deepcopy(HYPERLINK_RUN_PROPERTIES))
+
+    t = OxmlElement("w:t")
+    t.text = text
+    r.append(t)
+
+    hyperlink.append(r)
+    paragraph._element.append(hyperlink)
+
+
+def add_section(doc, heading, articles):
+    """
+    Adds a heading followed by each article's hyperlinked title and its URL.
+    """
+    doc.add_heading(heading, level=1)
+    for article in articles:
+        add_hyperlink(doc.add_paragraph(), article["Title"], article["URL"])
+        doc.add_paragraph(article["URL"])
+
+
+def write_report(heading, articles, path):
+    """
+    Renders the articles into a Word document and saves it once to `path`, returning the path.
+
+    The heading and articles are also kept next to the document as JSON (see snapshot_path)
+    so combined reports can be rebuilt later without scraping again. The snapshot is only
+    written once the document is in place, so it never holds articles the report lacks.
+    """
+    articles = list(articles)
+    with metrics.span("render"):
+        doc = Document()
+        add_section(doc, heading, articles)
+
+    # One "save" observation per report, covering the document and its snapshot
+    with metrics.span("save"):
+        tmp_path = _tmp_path_for(path)
+        doc.save(tmp_path)
+        os.replace(tmp_path, path)
+        write_snapshot(heading, articles, path)
+
+    print(f"✅ Word document created: {path}")
+    return path
+
+
+def snapshot_path(path):
+    return os.path.splitext(path)[0] + ".json"
+
+
+def write_snapshot(heading, articles, path):
+    tmp_path = _tmp_path_for(snapshot_path(path))
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"heading": heading, "articles": articles}, f, ensure_ascii=False)
+    os.replace(tmp_path, snapshot_path(path))
+
+
+def read_snapshot(path):
+    """
+    Returns the (heading, articles) a report at `path` was rendered from.
+    """
+    with open(snapshot_path(path), encoding="utf-8") as f:
+        snapshot = json.load(f)
+    return snapshot["heading"], snapshot["articles"]
+
+
+# **Streaming writer: same output as write_report, but memory stays flat for any number of articles**
+
+HYPERLINK_REL_TYPE = RELATIONSHIP_TYPE.HYPERLINK
+_HYPERLINK_RUN_PROPERTIES_XML = (
+    '<w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri"/><w:sz w:val="27"/>'
+    '<w:u w:val="single"/><w:color w:val="0000FF"/></w:rPr>'
+)
+# Characters XML 1.0 cannot carry at all; python-docx would reject them too
+_INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+
+def write_sections_streaming(sections, path):
+    """
+    Writes (heading, articles) sections straight into the .docx zip without building a document tree.
+
+    word/document.xml is streamed into the archive paragraph by paragraph. Hyperlink
+    relationships are spooled to a temporary file as they are issued and copied in afterwards,
+    because a zip can only have one member open for writing at a time. Styles, theme and
+    the other parts come from python-docx's default template so headings look the same.
+    """
+    with metrics.span("render"):
+        link_count = _write_docx_streaming(sections, path)
+    print(f"✅ Word document created: {path} ({link_count} links)")
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def _template_docx():
+    # python-docx's default template as saved by its public API, read once per process
+    buffer = io.BytesIO()
+    Document().save(buffer)
+    return buffer.getvalue()
+
+
+def _write_docx_streaming(sections, path):
+    tmp_path = _tmp_path_for(path)
+    with zipfile.ZipFile(io.BytesIO(_template_docx())) as template, \
+            zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as out, \
+            tempfile.TemporaryFile("w+", encoding="utf-8") as rels:
+        for name in template.namelist():
+            if name not in ("word/document.xml", "word/_rels/document.xml.rels"):
+                out.writestr(template.getinfo(name), template.read(name))
+
+        document_xml = template.read("word/document.xml").decode("utf-8")
+        body_start = document_xml.index("<w:body>") + len("<w:body>")
+        body_end = document_xml.index("<w:sectPr")
+
+        link_count = 0
+        with out.open("word/document.xml", "w") as doc:
+            doc.write(document_xml[:body_start].encode("utf-8"))
+            for heading, articles in sections:
+                doc.write(_heading_xml(heading))
+                for article in articles:
+                    link_count += 1
+                    r_id = f"rLink{link_count}"
+                    url = _clean(article["URL"])
+                    rels.write(
+                        f'<Relationship Id="{r_id}" Type="{HYPERLINK_REL_TYPE}" '
+                        f'Target={quoteattr(url)} TargetMode="External"/>'
+                    )
+                    doc.write(_article_xml(r_id, _clean(article["Title"]), url))
+            doc.write(document_xml[body_end:].encode("utf-8"))
+
+        rels_xml = template.read("word/_rels/document.xml.rels").decode("utf-8")
+        rels_end = rels_xml.index("</Relationships>")
+        rels.seek(0)
+        with out.open("word/_rels/document.xml.rels", "w") as rels_out:
+            rels_out.write(rels_xml[:rels_end].encode("utf-8"))
+            while chunk := rels.read(64 * 1024):
+                rels_out.write(chunk.encode("utf-8"))
+            rels_out.write(rels_xml[rels_end:].encode("utf-8"))
+
+    os.replace(tmp_path, path)
+    return link_count
+
+
+def _clean(text):
+    return _INVALID_XML_CHARS.sub("", str(text))
+
+
+def _text_run(text, properties=""):
+    return f'<w:r>{properties}<w:t xml:space="preserve">{escape(text)}</w:t></w:r>'
+
+
+def _heading_xml(heading):
+    return f'<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr>{_text_run(_clean(heading))}</w:p>'.encode("utf-8")
+
+
+def _article_xml(r_id, title, url):
+    return (
+        f'<w:p><w:hyperlink r:id="{r_id}">{_text_run(title, _HYPERLINK_RUN_PROPERTIES_XML)}</w:hyperlink></w:p>'
+        f"<w:p>{_text_run(url)}</w:p>"
+    ).encode("utf-8")
+
+
+def _tmp_path_for(path):
+    # Write next to the target and swap it in so downloads never see a half-written file
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
@@ -0,0 +1,114 @@
+import os
+import sqlite3
+import threading
+import time
+import metrics
+import registry
+import report
+import store
+
+OUTPUT_FOLDER = "output_files"
+
+# **Result cache settings (override with environment variables)**
+RESULT_TTL = float(os.environ.get("SCRAPER_RESULT_TTL", "900"))  # Seconds a report counts as fresh
+# Longest a report the scheduler keeps refreshing may count as fresh, for quiet sites it polls
+# less often than RESULT_TTL. Off (0) by default, so RESULT_TTL alone decides.
+SCHEDULED_TTL = float(os.environ.get("SCRAPER_SCHEDULED_RESULT_TTL", "0"))
+
+_inflight = {}  # Think tank -> scrape currently running for it
+_lock = threading.Lock()
+
+
+class _InFlight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def report_path(think_tank):
+    return os.path.join(OUTPUT_FOLDER, f"{think_tank}.docx")
+
+
+def load_articles(think_tank):
+    """
+    Returns the (heading, articles) behind the think tank's last report, or None if it has none.
+    """
+    try:
+        return report.read_snapshot(report_path(think_tank))
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def max_report_ttl():
+    return max(RESULT_TTL, SCHEDULED_TTL)
+
+
+def report_ttl(think_tank):
+    """
+    Seconds the think tank's report counts as fresh: RESULT_TTL, or with SCHEDULED_TTL set,
+    up to that while the scheduler refreshes the site less often (see scheduler.py).
+    """
+    if SCHEDULED_TTL <= RESULT_TTL:
+        return RESULT_TTL
+    try:
+        scheduled = store.report_ttl(think_tank)
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not read {think_tank} refresh schedule: {e}")
+        scheduled = None
+    return max(RESULT_TTL, min(scheduled or 0, SCHEDULED_TTL))
+
+
+def fresh_report(think_tank, ttl=None):
+    """
+    Returns the think tank's report path if it was generated within the last `ttl` seconds
+    (report_ttl by default), else None.
+    """
+    if ttl is None:
+        ttl = report_ttl(think_tank)
+    path = report_path(think_tank)
+    try:
+        age = time.time() - os.path.getmtime(path)
+    except OSError:
+        return None
+    return path if age < ttl else None
+
+
+def get_report(think_tank, force=False, ttl=None):
+    """
+    Returns a report for the think tank generated within the last `ttl` seconds (report_ttl
+    by default), scraping only when needed.
+
+    Concurrent callers for the same think tank share a single scrape. `force` skips the
+    freshness check but still joins a scrape that is already running.
+    """
+    if not force:
+        path = fresh_report(think_tank, ttl)
+        if path:
+            metrics.CACHE_HITS.inc(think_tank=think_tank, cache="report")
+            return path
+
+    with _lock:
+        call = _inflight.get(think_tank)
+        leader = call is None
+        if leader:
+            call = _inflight[think_tank] = _InFlight()
+
+    if not leader:
+        call.done.wait()
+        if call.error:
+            raise call.error
+        return call.result
+
+    try:
+        with metrics.scraping(think_tank):
+            call.result = registry.run(think_tank)
+        return call.result
+    except Exception as e:
+        metrics.FAILURES.inc(think_tank=think_tank)
+        call.error = e
+        raise
+    finally:
+        with _lock:
+            del _inflight[think_tank]
+        call.done.set()
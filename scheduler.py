@@ -0,0 +1,203 @@
+import heapq
+import os
+import random
+import threading
+import sqlite3
+import time
+import results
+import sites
+import store
+
+# **Background refresh settings (override with environment variables)**
+ENABLED = os.environ.get("SCRAPER_SCHEDULER") == "1"
+INTERVAL = float(os.environ.get("SCRAPER_SCHEDULE_INTERVAL", str(results.RESULT_TTL * 2 / 3)))  # Seconds between refreshes
+JITTER = float(os.environ.get("SCRAPER_SCHEDULE_JITTER", "0.1"))  # +/- fraction of the interval
+STAGGER = float(os.environ.get("SCRAPER_SCHEDULE_STAGGER", "15"))  # Seconds between first runs at start-up
+# **Adaptive intervals: poll busy sites more often and quiet ones less, within these bounds**
+ADAPTIVE = os.environ.get("SCRAPER_SCHEDULE_ADAPTIVE", "1") != "0"
+MIN_INTERVAL = float(os.environ.get("SCRAPER_SCHEDULE_MIN_INTERVAL", "300"))
+MAX_INTERVAL = float(os.environ.get("SCRAPER_SCHEDULE_MAX_INTERVAL", "21600"))
+TARGET_NEW = float(os.environ.get("SCRAPER_SCHEDULE_TARGET_NEW", "1"))  # New articles we aim to find per refresh
+# A report younger than this share of the interval (e.g. one a user just refreshed) is not scraped again
+FRESH_FRACTION = float(os.environ.get("SCRAPER_SCHEDULE_FRESH_FRACTION", "0.75"))
+GRACE = float(os.environ.get("SCRAPER_SCHEDULE_GRACE", "300"))  # Seconds a scheduled refresh may take to land
+LOCK_FILE = os.environ.get("SCRAPER_SCHEDULER_LOCK", ".scheduler.lock")  # Only one process per host runs the schedule
+
+_lock_file = None  # Held open for the life of the process that runs the schedule
+
+
+class Scheduler:
+    """
+    Refreshes every think tank's report in the background, before its cached copy goes stale,
+    so downloads are served from cache instead of waiting on a scrape.
+
+    Each site is refreshed every `refresh_interval` seconds from its spec (or INTERVAL), plus
+    or minus JITTER so sites drift apart instead of hitting the network in lockstep. First runs
+    are STAGGER seconds apart, and a site whose report is already recent waits until it ages.
+    The same goes for every later run: a report refreshed in the meantime (say by a user)
+    pushes the site's next run back instead of being scraped again.
+
+    With `adaptive`, sites without a fixed refresh_interval are instead polled about as often
+    as they publish: the interval is the time the site takes to publish TARGET_NEW articles,
+    judged from its recent runs in the article store, kept between MIN_INTERVAL and MAX_INTERVAL.
+    It is also kept short enough that each report is replaced, GRACE seconds included, before
+    it stops counting as fresh (results.max_report_ttl), so /run_scraper and /digest never
+    scrape a site the scheduler is keeping warm.
+
+    Every booking also tells results how long the site's report has to last (until the next
+    run has had GRACE seconds to land). With SCRAPER_SCHEDULED_RESULT_TTL set, quiet sites'
+    reports stay fresh that long, up to that setting, and may be polled that rarely.
+    """
+
+    def __init__(self, submit, site_list=None, interval=INTERVAL, jitter=JITTER, stagger=STAGGER, adaptive=ADAPTIVE):
+        site_list = site_list or sites.SITES
+        self._submit = submit  # Called with a think tank name and a max report age to queue its refresh
+        self._intervals = {site.name: site.refresh_interval or interval for site in site_list}
+        self._adaptive = {site.name for site in site_list if adaptive and not site.refresh_interval}
+        self._jitter = jitter
+        self._stagger = stagger
+        # Longest adaptive interval whose report, with jitter and GRACE, is replaced while still fresh
+        self._max_interval = max(min(MAX_INTERVAL, (results.max_report_ttl() - GRACE) / (1 + jitter)), MIN_INTERVAL)
+        self._queue = []  # (due time, think tank) heap
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        now = time.time()
+        with self._lock:
+            for position, think_tank in enumerate(self._intervals):
+                due = max(now + position * self._stagger, self._report_due(think_tank))
+                heapq.heappush(self._queue, (due, think_tank))
+            queue = list(self._queue)
+        for due, think_tank in queue:
+            self._booked(think_tank, due)
+        self._thread = threading.Thread(target=self._run, name="scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def status(self):
+        """
+        Returns each think tank's next scheduled refresh (Unix timestamp) and current interval.
+        """
+        with self._lock:
+            queue = sorted(self._queue)
+        return {think_tank: {"due": due, "interval": round(self.interval(think_tank))} for due, think_tank in queue}
+
+    def interval(self, think_tank):
+        """
+        Returns the think tank's current refresh interval in seconds.
+        """
+        if think_tank not in self._adaptive:
+            return self._intervals[think_tank]
+        try:
+            rate = store.change_rate(think_tank)
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not read {think_tank} run history: {e}")
+            rate = None
+        if rate is None:
+            return self._intervals[think_tank]  # Not enough history yet
+        if rate <= 0:
+            return self._max_interval
+        return min(max(TARGET_NEW / rate, MIN_INTERVAL), self._max_interval)
+
+    def next_delay(self, think_tank):
+        return self.interval(think_tank) * random.uniform(1 - self._jitter, 1 + self._jitter)
+
+    def _report_due(self, think_tank):
+        # A report refreshed recently (by a user or another run) only needs refreshing once it ages
+        try:
+            return os.path.getmtime(results.report_path(think_tank)) + self.interval(think_tank)
+        except OSError:
+            return 0
+
+    def _booked(self, think_tank, due):
+        # Shared through the article store: /schedule may be answered by another process, and
+        # the report only needs to stay fresh until the run booked for `due` has replaced it
+        interval = self.interval(think_tank)
+        ttl = max(due - time.time(), interval) + GRACE
+        try:
+            store.record_scheduled_run(think_tank, due, interval)
+            store.set_report_ttl(think_tank, ttl, due + GRACE)
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not record {think_tank} refresh schedule: {e}")
+
+    def _report_age(self, think_tank):
+        try:
+            return time.time() - os.path.getmtime(results.report_path(think_tank))
+        except OSError:
+            return float("inf")
+
+    def _run(self):
+        while not self._stop.is_set() and self._queue:
+            with self._lock:
+                due, think_tank = self._queue[0]
+            if due > time.time():
+                self._stop.wait(min(due - time.time(), 60))
+                continue
+
+            # Book the next run first so status() never loses a site while it is being submitted.
+            # A report refreshed since the last run counts from its own age instead of being scraped again.
+            ttl = self.interval(think_tank) * FRESH_FRACTION
+            age = self._report_age(think_tank)
+            recent = age < ttl
+            next_due = time.time() - (age if recent else 0) + self.next_delay(think_tank)
+            with self._lock:
+                heapq.heapreplace(self._queue, (next_due, think_tank))
+            self._booked(think_tank, next_due)
+            if recent:
+                continue
+            try:
+                self._submit(think_tank, ttl)
+            except Exception as e:
+                print(f"⚠️ Could not schedule a refresh of {think_tank}: {e}")
+
+
+def acquire_lock(path=LOCK_FILE):
+    """
+    Returns an open, exclusively locked file if this process should run the schedule, else None.
+
+    The app runs as one gunicorn worker with several threads, because jobs live in process
+    memory. The lock only stops a second process on the host, such as the debug reloader's
+    parent or an instance started by mistake, from refreshing every site again.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return open(path, "a")  # No flock on this platform, so every process schedules
+    lock = open(path, "a")
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock.close()
+        return None
+    return lock
+
+
+def status():
+    """
+    Returns each think tank's next scheduled refresh as booked by whichever process holds the
+    lock, read from the article store so every process gives the same answer.
+    """
+    try:
+        return store.scheduled_runs(since=time.time() - GRACE)
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not read the refresh schedule: {e}")
+        return {}
+
+
+def start(submit):
+    """
+    Starts the background scheduler if this process wins the lock, returning it (or None).
+    """
+    global _lock_file
+    _lock_file = acquire_lock()
+    if _lock_file is None:
+        print("⚠️ Another process is running the refresh schedule, not starting one here.")
+        return None
+    scheduler = Scheduler(submit)
+    scheduler.start()
+    print(f"✅ Background refresh scheduled for {len(scheduler.status())} think tanks.")
+    return scheduler
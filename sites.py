@@ -0,0 +1,314 @@
+import re
+from dataclasses import dataclass, field
+import soupsieve
+from bs4 import SoupStrainer
+import ratelimit
+
+
+@dataclass(frozen=True)
+class Api:
+    """
+    A JSON endpoint that backs a JS-rendered listing (see fetch.get_api_articles).
+    """
+
+    url: str
+    fields: dict  # Article key -> dotted path inside each item, e.g. {"Title": "title.rendered"}
+    params: dict = None
+    items_path: str = None  # Where the list of items sits when the response wraps it
+
+
+@dataclass(frozen=True)
+class Site:
+    """
+    Everything the engine needs to scrape one think tank. Selectors are CSS and are
+    compiled once when the spec is created.
+
+    Each element matching `item` is one article. Its link is the `link` element inside it,
+    the item itself when `link` is None, or the enclosing <a> with `link_in_parent`. The
+    title is the `title` element inside the item, or else the link's (or item's) text.
+    Items without a title or link are skipped.
+    """
+
+    name: str  # Registry key, also names the report (output_files/<name>.docx)
+    url: str
+    item: str
+    link: str = None
+    link_in_parent: bool = False
+    title: str = None
+    date: str = None
+    limit: int = None  # Keep only the first `limit` items
+    label: str = None  # "Think Tank" column, defaults to `name`
+    heading: str = None  # Report heading, defaults to `label`
+    csv_name: str = None
+    base_url: str = None  # Relative links resolve against this, defaults to `url`
+    only: tuple = None  # (name, attrs) for the SoupStrainer that skips everything but the listing
+
+    # **Where the listing comes from**
+    http: bool = True  # Try plain HTTP for `url` and `page_urls`
+    page_urls: tuple = ()  # Further listing pages fetched in parallel with `url`
+    api: Api = None  # JSON endpoint tried before anything else
+    browser: bool = False  # Fall back to (or, without `http`, always use) Chrome
+
+    # **Politeness, on top of the per-host defaults in ratelimit.py**
+    crawl_delay: float = None  # Minimum seconds between requests to the site's hosts
+    concurrency: int = None  # Requests (or browser tabs) in flight at once
+
+    # **Background refresh (see scheduler.py)**
+    refresh_interval: int = None  # Seconds between scheduled refreshes, defaults to scheduler.INTERVAL
+
+    # **Browser-only settings**
+    wait: str = None  # Readiness selector, defaults to the item's link
+    wait_timeout: int = 15
+    next_pages: tuple = ()  # XPaths of page buttons clicked in order
+    show_more: str = None  # CSS selector of a "show more" button
+    show_more_clicks: int = 3
+
+    _item: object = field(init=False, repr=False, compare=False)
+    _link: object = field(init=False, repr=False, compare=False)
+    _title: object = field(init=False, repr=False, compare=False)
+    _date: object = field(init=False, repr=False, compare=False)
+    _strainer: object = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        compiled = {
+            "_item": soupsieve.compile(self.item),
+            "_link": soupsieve.compile(self.link) if self.link else None,
+            "_title": soupsieve.compile(self.title) if self.title else None,
+            "_date": soupsieve.compile(self.date) if self.date else None,
+            "_strainer": SoupStrainer(*self.only) if self.only else None,
+        }
+        for name, value in compiled.items():
+            object.__setattr__(self, name, value)
+
+    @property
+    def think_tank(self):
+        return self.label or self.name
+
+    @property
+    def link_base(self):
+        return self.base_url or self.url
+
+    @property
+    def report_heading(self):
+        return self.heading or self.think_tank
+
+    @property
+    def csv_filename(self):
+        return self.csv_name or f"{self.think_tank.replace(' ', '_')}_articles.csv"
+
+    @property
+    def wait_selector(self):
+        return self.wait or (f"{self.item} {self.link}" if self.link else self.item)
+
+
+# **Every think tank the app scrapes. Adding a site only takes a new entry here.**
+SITES = [
+    Site(
+        name="Atlantic Council",
+        url="https://www.atlanticcouncil.org/in-depth-research-reports/",
+        item="a.gta-embed--link.gta-post-embed--link",
+        title="h4.gta-post-embed--title.gta-embed--title",
+        csv_name="ac_results.csv",
+        only=("a", {"class": "gta-embed--link gta-post-embed--link"}),
+    ),
+    Site(
+        name="AEI",
+        url="https://www.aei.org/research-products/",
+        item="h4.post__title",
+        link="a[href]",
+        heading="American Enterprise Institute (AEI)",
+        only=("h4", {"class": "post__title"}),
+    ),
+    Site(
+        name="Baker Institute",
+        url="https://www.bakerinstitute.org/research-library",
+        item="a.coh-link.coh-ce-cpt_research_listing_horizontal_-766ca3e5",
+        only=("a", {"class": "coh-link coh-ce-cpt_research_listing_horizontal_-766ca3e5"}),
+        http=False,
+        browser=True,
+    ),
+    Site(
+        name="Belfer Center",
+        url="https://www.belfercenter.org/research-analysis",
+        item="h3.card-title",
+        link="a.card-link.js-link-event-link",
+        wait="h3.card-title a.card-link",
+        only=("h3", {"class": "card-title"}),
+        http=False,
+        browser=True,
+    ),
+    Site(
+        name="Brookings Institution",
+        url="https://www.brookings.edu/research-commentary/",
+        item="a.overlay-link",
+        title="span.sr-only",
+        label="Brookings",
+        only=("a", {"class": "overlay-link"}),
+        http=False,
+        # About as many posts as three "Show More" clicks load
+        api=Api(
+            url="https://www.brookings.edu/wp-json/wp/v2/posts",
+            fields={"Title": "title.rendered", "URL": "link"},
+            params={"per_page": 40, "_fields": "title,link"},
+        ),
+        browser=True,
+        show_more=".btn.btn-outline-alt.w-full",
+    ),
+    Site(
+        name="Carnegie Endowment",
+        url="https://carnegieendowment.org/research?lang=en",
+        item='a.anchor[href*="/research/"]',
+        title="div.h5.direction-ltr.typography.heading",
+        heading="Carnegie Endowment for International Peace",
+        csv_name="CEIP_results.csv",
+        only=("a", {"class": "anchor"}),
+    ),
+    Site(
+        name="Chicago Council",
+        url="https://globalaffairs.org/research",
+        item="a.listing_teaser_title_link",
+        title="span.listing_teaser_title_text",
+        only=("a", {"class": "listing_teaser_title_link"}),
+        http=False,
+        browser=True,
+    ),
+    Site(
+        name="CSIS",
+        url="https://www.csis.org/analysis",
+        item="h3.headline-sm.mb-xs.text-high-contrast",
+        link="a.hocus-headline",
+        title="a.hocus-headline span",
+        only=("h3", {"class": "headline-sm mb-xs text-high-contrast"}),
+        # Drupal counts ?page= from 0, so page 2 is ?page=1
+        page_urls=("https://www.csis.org/analysis?page=1", "https://www.csis.org/analysis?page=2"),
+        browser=True,
+        wait="h3.headline-sm a.hocus-headline",
+        wait_timeout=20,
+        next_pages=('//a[@title="Go to page 2"]', '//a[@title="Go to page 3"]'),
+    ),
+    Site(
+        name="FDD",
+        url="https://www.fdd.org/category/analysis/",
+        item="h4.post-title",
+        link_in_parent=True,
+        only=("a", {"href": True}),  # Titles are matched inside their parent link
+        page_urls=("https://www.fdd.org/category/analysis/page/2/", "https://www.fdd.org/category/analysis/page/3/"),
+        browser=True,
+        wait_timeout=20,
+        next_pages=(
+            '//span[@class="pagination-not-current" and text()="2"]',
+            '//span[@class="pagination-not-current" and text()="3"]',
+        ),
+    ),
+    Site(
+        name="GMF",
+        url="https://www.gmfus.org/insights-research",
+        item="h3",
+        link="a[href]",
+        only=("h3", {}),
+    ),
+    Site(
+        name="Heritage Foundation",
+        url="https://www.heritage.org/",
+        item="h4.view-list--header",
+        link_in_parent=True,
+        label="Heritage",
+        heading="Heritage Foundation",
+        crawl_delay=2,  # Its WAF answers bursts with 403
+        concurrency=1,
+        only=(["a", "h4"], {}),  # Titles are matched inside their parent link
+    ),
+    Site(
+        name="Hudson Institute",
+        url="https://www.hudson.org/search?hud-content-type=259&expert=&date-from=&date-to=&keywords=&topics=All&region=All",
+        item=".c-horizontal-card__title",
+        title="span",
+        limit=20,
+        csv_name="Hudson_Articles.csv",
+        http=False,
+        browser=True,
+    ),
+    Site(
+        name="MEI",
+        url="https://www.mei.edu/policy-analysis",
+        item="article.feature.feature-1",
+        link="h4 a[href]",
+        date="span.feature__date",
+        limit=20,
+        only=("article", {"class": "feature feature-1"}),
+    ),
+    Site(
+        name="Pew Research Center",
+        url="https://www.pewresearch.org/publications/",
+        item="h2.header.medium",
+        link="a[href]",
+        heading="Pew Institute",
+        csv_name="Pew_Research_articles.csv",
+        only=("h2", {"class": "header medium"}),
+        http=False,
+        api=Api(
+            url="https://www.pewresearch.org/wp-json/wp/v2/posts",
+            fields={"Title": "title.rendered", "URL": "link"},
+            params={"per_page": 20, "_fields": "title,link"},
+        ),
+        browser=True,
+    ),
+    Site(
+        name="PIIE",
+        url="https://www.piie.com/research",
+        item="h2.teaser__title",
+        link="a[href]",
+        label="Peterson Institute",
+        only=("h2", {"class": "teaser__title"}),
+        http=False,
+        browser=True,
+    ),
+    Site(
+        name="Quincy Institute",
+        url="https://quincyinst.org/research/",
+        item="h2.post-title",
+        link="a[href]",
+        only=("h2", {"class": "post-title"}),
+    ),
+    Site(
+        name="Stimson Center",
+        url="https://www.stimson.org/",
+        item='a[href^="https://www.stimson.org/20"]',  # Dated paths are articles, the rest is navigation
+        label="Stimson",
+        heading="Stimson Institute",
+        only=("a", {"href": re.compile(r"^https://www\.stimson\.org/20")}),
+    ),
+    Site(
+        name="USIP",
+        url="https://www.usip.org/publications",
+        item="h3.summary__heading",
+        link="a[href]",
+        only=("h3", {"class": "summary__heading"}),
+        http=False,
+        browser=True,
+    ),
+    Site(
+        name="Wilson Center",
+        url="https://www.wilsoncenter.org/insight-analysis",
+        item="h2.title.h4.-blue-600",
+        link="a[href]",
+        only=("h2", {"class": "title h4 -blue-600"}),
+        # Drupal counts ?page= from 0, so page 2 is ?page=1
+        page_urls=("https://www.wilsoncenter.org/insight-analysis?page=1",),
+        browser=True,
+        wait="h2.title.h4 a",
+        wait_timeout=20,
+        next_pages=('//a[@data-value="2"]',),
+    ),
+    Site(
+        name="WINEP",
+        url="https://www.washingtoninstitute.org/policy-analysis",
+        item=r"a.teaser.block.lg\:flex.mb-30",
+        title="span.heading.link",
+        only=("a", {"class": "teaser block lg:flex mb-30"}),
+    ),
+]
+
+# **Share each site's politeness settings with the rate limiter used by fetch and the browser**
+for site in SITES:
+    ratelimit.configure_site(site)
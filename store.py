@@ -0,0 +1,217 @@
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# **Article store settings (override with environment variables)**
+DB_PATH = os.environ.get("SCRAPER_DB_PATH", "articles.db")
+INCREMENTAL = os.environ.get("SCRAPER_INCREMENTAL") == "1"  # Paginating scrapers stop at the first page with nothing new
+
+# Query parameters that only track where a click came from and never change the article
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "source"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    think_tank TEXT NOT NULL,
+    title TEXT,
+    date TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS articles_url ON articles (url);
+CREATE INDEX IF NOT EXISTS articles_think_tank ON articles (think_tank, first_seen);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    think_tank TEXT NOT NULL,
+    finished_at REAL NOT NULL,
+    articles INTEGER NOT NULL,
+    new_articles INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_think_tank ON runs (think_tank, finished_at);
+CREATE TABLE IF NOT EXISTS scheduled_runs (
+    think_tank TEXT PRIMARY KEY,
+    due REAL NOT NULL,
+    interval REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS report_ttls (
+    think_tank TEXT PRIMARY KEY,
+    ttl REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+UPSERT = """
+INSERT INTO articles (url, think_tank, title, date, first_seen, last_seen)
+VALUES (:url, :think_tank, :title, :date, :seen, :seen)
+ON CONFLICT (url) DO UPDATE SET
+    think_tank = excluded.think_tank,
+    title = excluded.title,
+    date = COALESCE(excluded.date, articles.date),
+    last_seen = excluded.last_seen
+"""
+
+_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_ready = set()
+
+
+def connect():
+    """
+    Returns this thread's connection to the article store, creating the schema on first use.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH, timeout=30)
+        conn.row_factory = sqlite3.Row
+        # WAL lets the web workers read while a scrape is writing
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with _schema_lock:
+            if DB_PATH not in _schema_ready:
+                conn.executescript(SCHEMA)
+                _schema_ready.add(DB_PATH)
+        _local.conn = conn
+    return conn
+
+
+def canonical_url(url):
+    """
+    Normalizes a URL so the same article is stored once: https scheme, lower-case host,
+    no fragment, no tracking parameters, sorted query and no trailing slash.
+    Returns None for anything that isn't an absolute http(s) URL (e.g. "No URL").
+    """
+    parts = urlsplit(str(url).strip())
+    if parts.scheme.lower() not in ("http", "https") or not parts.netloc:
+        return None
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith("utm_") and key not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("https", parts.netloc.lower(), path, urlencode(query), ""))
+
+
+def known_urls(urls):
+    """
+    Returns the subset of `urls` (canonicalized) that are already in the store.
+    """
+    canonical = {canonical_url(url) for url in urls} - {None}
+    if not canonical:
+        return set()
+    placeholders = ",".join("?" * len(canonical))
+    rows = connect().execute(f"SELECT url FROM articles WHERE url IN ({placeholders})", tuple(canonical))
+    return {row["url"] for row in rows}
+
+
+def upsert_articles(think_tank, articles):
+    """
+    Records a scrape's articles in one batch, together with the run's stats (see change_rate),
+    and returns how many of them were new.
+    """
+    seen = time.time()
+    rows = {}
+    for article in articles:
+        url = canonical_url(article["URL"])
+        if url is None:
+            continue
+        date = article.get("Date")
+        rows[url] = {
+            "url": url,
+            "think_tank": think_tank,
+            "title": article["Title"],
+            "date": None if date in (None, "", "No Date") else date,
+            "seen": seen,
+        }
+
+    try:
+        conn = connect()
+        with conn:
+            new_count = len(rows) - len(known_urls(rows))
+            conn.executemany(UPSERT, rows.values())
+            conn.execute(
+                "INSERT INTO runs (think_tank, finished_at, articles, new_articles) VALUES (?, ?, ?, ?)",
+                (think_tank, seen, len(rows), new_count),
+            )
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not record {think_tank} articles in the store: {e}")
+        return 0
+    return new_count
+
+
+def change_rate(think_tank, window=5):
+    """
+    Estimates how many new articles the think tank publishes per second from its last
+    `window` runs, or returns None until there are at least two runs to compare.
+    """
+    rows = connect().execute(
+        "SELECT finished_at, new_articles FROM runs WHERE think_tank = ? ORDER BY finished_at DESC LIMIT ?",
+        (think_tank, window),
+    ).fetchall()
+    if len(rows) < 2:
+        return None
+    # The oldest run's new articles appeared before the window started, so only count the later ones
+    elapsed = rows[0]["finished_at"] - rows[-1]["finished_at"]
+    if elapsed <= 0:
+        return None
+    return sum(row["new_articles"] for row in rows[:-1]) / elapsed
+
+
+def record_scheduled_run(think_tank, due, interval):
+    """
+    Records the think tank's next scheduled refresh, so any process can report the schedule.
+    """
+    conn = connect()
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO scheduled_runs (think_tank, due, interval) VALUES (?, ?, ?)",
+            (think_tank, due, interval),
+        )
+
+
+def scheduled_runs(since):
+    """
+    Returns {think tank: {"due", "interval"}} for refreshes due after `since`, soonest first.
+    """
+    rows = connect().execute(
+        "SELECT think_tank, due, interval FROM scheduled_runs WHERE due > ? ORDER BY due", (since,)
+    )
+    return {row["think_tank"]: {"due": row["due"], "interval": round(row["interval"])} for row in rows}
+
+
+def set_report_ttl(think_tank, ttl, expires_at):
+    """
+    Records that the think tank's report counts as fresh for `ttl` seconds, because the
+    scheduler refreshes it that often. The setting lapses at `expires_at` unless renewed,
+    so a stopped scheduler stops stretching freshness.
+    """
+    conn = connect()
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO report_ttls (think_tank, ttl, expires_at) VALUES (?, ?, ?)",
+            (think_tank, ttl, expires_at),
+        )
+
+
+def report_ttl(think_tank):
+    """
+    Returns the think tank's current scheduled report TTL in seconds, or None if it has none.
+    """
+    row = connect().execute(
+        "SELECT ttl FROM report_ttls WHERE think_tank = ? AND expires_at > ?", (think_tank, time.time())
+    ).fetchone()
+    return row["ttl"] if row else None
+
+
+def only_known(articles):
+    """
+    True when a page of articles holds nothing new, i.e. every link is already in the store.
+    """
+    canonical = {canonical_url(article["URL"]) for article in articles} - {None}
+    try:
+        return bool(canonical) and canonical <= known_urls(canonical)
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not check the article store: {e}")
+        return False
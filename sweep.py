@@ -0,0 +1,47 @@
+import asyncio
+import os
+import time
+import browser_pool
+import registry
+import results
+
+# **Sweep settings (override with environment variables)**
+HTTP_CONCURRENCY = int(os.environ.get("SCRAPER_SWEEP_HTTP_CONCURRENCY", "8"))  # Static-HTML scrapers in flight at once
+
+
+def new_progress(think_tanks):
+    """
+    Returns the per-site progress table a sweep fills in as it runs.
+    """
+    return {think_tank: {"status": "queued"} for think_tank in think_tanks}
+
+
+def run_all(progress, force=False):
+    """
+    Runs every scraper in `progress` concurrently and returns the paths of the reports produced.
+    Reports that are still fresh are reused unless `force` is set.
+    """
+    asyncio.run(_run_all(progress, force))
+    return {think_tank: entry.get("result") for think_tank, entry in progress.items()}
+
+
+async def _run_all(progress, force):
+    # Static sites only wait on the network, browser-only sites are capped by the number of Chrome sessions.
+    # Sites that fall back to Chrome run with the static ones and queue on the pool only if they need it.
+    http_slots = asyncio.Semaphore(HTTP_CONCURRENCY)
+    browser_slots = asyncio.Semaphore(browser_pool.POOL_SIZE)
+
+    async def run_one(think_tank):
+        slots = browser_slots if registry.uses_browser(think_tank) else http_slots
+        async with slots:
+            started = time.time()
+            progress[think_tank] = {"status": "running", "started_at": started}
+            try:
+                # Scrapers are blocking code, so each runs on a worker thread while the loop schedules the rest
+                result = await asyncio.to_thread(results.get_report, think_tank, force)
+                progress[think_tank] = {"status": "done", "result": result, "seconds": round(time.time() - started, 2)}
+            except Exception as e:
+                print(f"❌ {think_tank} failed during sweep: {e}")
+                progress[think_tank] = {"status": "failed", "error": str(e), "seconds": round(time.time() - started, 2)}
+
+    await asyncio.gather(*(run_one(think_tank) for think_tank in progress))
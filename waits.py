@@ -0,0 +1,60 @@
+import os
+import time
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+# **Readiness wait settings (override with environment variables)**
+DEFAULT_TIMEOUT = float(os.environ.get("SCRAPER_WAIT_TIMEOUT", "15"))  # Ceiling when a site doesn't set its own
+POLL_INTERVAL = 0.25
+STABLE_FOR = 0.75  # Seconds the article count must stay unchanged before the page counts as ready
+
+
+def wait_for_articles(driver, selector, timeout=DEFAULT_TIMEOUT):
+    """
+    Waits until at least one element matches the CSS selector and their count stops changing.
+    Returns the final count; on timeout it returns whatever is there instead of raising.
+    """
+    deadline = time.monotonic() + timeout
+    count, stable_since = -1, None
+    while True:
+        current = len(driver.find_elements(By.CSS_SELECTOR, selector))
+        now = time.monotonic()
+        if current != count:
+            count, stable_since = current, now
+        elif count > 0 and now - stable_since >= STABLE_FOR:
+            return count
+        if now >= deadline:
+            print(f"⚠️ Timed out after {timeout}s waiting for '{selector}' ({count} found).")
+            return count
+        time.sleep(POLL_INTERVAL)
+
+
+def click_and_wait(driver, element, selector, timeout=DEFAULT_TIMEOUT):
+    """
+    Clicks a pagination control and waits for the listing to change, either by replacing
+    the current articles (next page) or by appending to them ("show more").
+    Returns the article count after the change, or the unchanged count on timeout.
+    """
+    before = driver.find_elements(By.CSS_SELECTOR, selector)
+    driver.execute_script("arguments[0].click();", element)
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if len(driver.find_elements(By.CSS_SELECTOR, selector)) > len(before):
+            break
+        if before and _is_stale(before[0]):
+            break
+        time.sleep(POLL_INTERVAL)
+    else:
+        print(f"⚠️ Listing did not change within {timeout}s after clicking.")
+        return len(before)
+
+    return wait_for_articles(driver, selector, timeout=max(deadline - time.monotonic(), STABLE_FOR))
+
+
+def _is_stale(element):
+    try:
+        element.is_enabled()
+        return False
+    except StaleElementReferenceException:
+        return True